@@ -30,14 +30,24 @@ class SynXisPMSSettings(MCPServerSettings):
 
 
 def start_server_handler() -> None:
-    """Start handler that launches the SynXis PMS MCP server in HTTP mode."""
+    """Start handler that launches the SynXis PMS MCP server in HTTP mode.
+
+    Runs on uvloop with the httptools parser ("auto" picks them whenever they
+    are installed) and without per-request access logging. For multi-core
+    deployments run the app under gunicorn instead, e.g.
+    ``gunicorn -k uvicorn.workers.UvicornWorker -w $((2 * NCPU + 1))
+    synxis_pms_mcp.server:http_app``.
+    """
     settings = SynXisPMSSettings()
     print(f"Starting SynXis PMS MCP server on port {settings.http_port}...")
     uvicorn.run(
         "synxis_pms_mcp.server:http_app",
         host="127.0.0.1",
         port=settings.http_port,
-        log_level="info",
+        loop="auto",
+        http="auto",
+        access_log=False,
+        log_level="warning",
     )
 
 
@@ -2,42 +2,232 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import random
-import uuid
-from datetime import date, datetime
-from typing import Any
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from typing import Any, TypeVar
 
 import httpx
-
-from .config import SynXisPMSSettings, get_logger_instance, get_settings
+import orjson
+from cachetools import LRUCache, TTLCache
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+from .config import (
+    SynXisPMSSettings,
+    get_logger_instance,
+    get_settings,
+    is_log_enabled,
+)
 from .models import (
+    CHARGE_LIST_ADAPTER,
+    PAYMENT_LIST_ADAPTER,
     Charge,
     CheckInResult,
     CheckOutResult,
     Folio,
     Guest,
-    GuestStatus,
     Payment,
     PaymentMethod,
     Room,
-    RoomAssignment,
     RoomStatus,
     SynXisPMSError,
 )
 
 logger = get_logger_instance("synxis-pms-mcp.client")
 
+T = TypeVar("T")
+
+# Refresh tokens this many seconds before the server-reported expiry
+# (at most half the token's lifetime).
+_TOKEN_REFRESH_MARGIN = 60.0
+_DEFAULT_TOKEN_LIFETIME = 3600.0
+
+# Dedicated generator for mock data so seeding it (see SynXisPMSClient.seed)
+# neither affects nor depends on the global ``random`` state.
+_rng = random.Random()
+
+_ROOM_STATUSES = tuple(RoomStatus)
+_MOCK_GUEST_PREFERENCES = ("High floor", "Non-smoking")
+_MOCK_ROOM_FEATURES = ("WiFi", "Mini Bar", "Safe", "Iron")
+
+# Mock folio: fixed charges and a single payment, so the totals are constant.
+_MOCK_CHARGE_COUNT = 3
+_MOCK_CHARGE_AMOUNT = 199.99
+_MOCK_PAYMENT_AMOUNT = 200.00
+_MOCK_FOLIO_CHARGES = round(_MOCK_CHARGE_COUNT * _MOCK_CHARGE_AMOUNT, 2)
+_MOCK_FOLIO_BALANCE = round(_MOCK_FOLIO_CHARGES - _MOCK_PAYMENT_AMOUNT, 2)
+
+_MOCK_GUEST_TEMPLATE = Guest(
+    guest_id="",
+    first_name="John",
+    last_name="Doe",
+    email="john.doe@example.com",
+    phone="+1-555-0100",
+    address="123 Main Street",
+    city="New York",
+    country="US",
+    loyalty_tier="Gold",
+    preferences=list(_MOCK_GUEST_PREFERENCES),
+)
+_MOCK_ROOM_TEMPLATE = Room(
+    room_id="",
+    room_number="",
+    room_type="DLX",
+    room_type_name="Deluxe Room",
+    status=RoomStatus.AVAILABLE,
+    features=list(_MOCK_ROOM_FEATURES),
+    max_occupancy=2,
+)
+
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Upper bound on a server-provided Retry-After, in seconds.
+_MAX_RETRY_AFTER = 60.0
+
+# Shared HTTP clients, per event loop (a client's pooled connections belong
+# to the loop they were opened on) and per transport configuration.
+_shared_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[Any, ...], httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter, to avoid synchronized retries."""
+    return random.uniform(0, 2**attempt)
+
+
+def _retry_delay(attempt: int, response: httpx.Response) -> float:
+    """Delay before retrying ``response``, honoring a numeric Retry-After."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return _backoff_delay(attempt)
+
+
+def _error_from_response(response: httpx.Response) -> SynXisPMSError:
+    """Build the error for a failed response, decoding its body once."""
+    try:
+        error_body = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        error_body = {"message": response.text}
+    if not isinstance(error_body, dict):
+        error_body = {}
+
+    return SynXisPMSError(
+        message=error_body.get("message", f"API error: {response.status_code}"),
+        status=response.status_code,
+    )
+
+
+def _build_http_client(settings: SynXisPMSSettings) -> httpx.AsyncClient:
+    # Explicit pool sizing: httpx's defaults throttle concurrent tool
+    # fan-out and force fresh TCP/TLS handshakes under bursts.
+    config = {
+        "limits": httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        "http2": settings.http2,
+        **settings.http_client_config,
+    }
+    return httpx.AsyncClient(**config)
+
+
+def _client_config_key(settings: SynXisPMSSettings) -> tuple[Any, ...]:
+    """The settings that shape an HTTP client built by ``_build_http_client``."""
+    return (
+        settings.base_url,
+        settings.timeout,
+        settings.max_connections,
+        settings.max_keepalive_connections,
+        settings.keepalive_expiry,
+        settings.http2,
+    )
+
+
+async def get_shared_client(
+    settings: SynXisPMSSettings | None = None,
+) -> httpx.AsyncClient:
+    """Get the shared HTTP client for ``settings``, creating it on first use.
+
+    Clients are shared between settings with the same transport configuration
+    (base URL, timeout, pool limits, HTTP/2) on the same event loop. Callers
+    with a different configuration, or running on another loop (e.g. a second
+    ``asyncio.run``), get their own client instead of one whose pooled
+    connections belong elsewhere.
+    """
+    settings = settings or get_settings()
+    clients = _shared_clients.setdefault(asyncio.get_running_loop(), {})
+    key = _client_config_key(settings)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        # No await between the lookup and the store, so no lock is needed.
+        client = clients[key] = _build_http_client(settings)
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP clients created on the running event loop."""
+    clients = _shared_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
 
 class SynXisPMSClient:
-    """Async HTTP client for SynXis PMS API with mock mode support."""
+    """Async HTTP client for SynXis PMS API with mock mode support.
+
+    Settings are read once at construction; changing them afterwards does not
+    affect an existing client.
+    """
 
     def __init__(self, settings: SynXisPMSSettings | None = None) -> None:
-        self.settings = settings or get_settings()
+        self.settings = s = settings or get_settings()
         self._client: httpx.AsyncClient | None = None
+        # Resolved once; every request and token refresh reuses these.
+        self._mock = s.mock_mode
+        self._property_id = s.property_id
+        self._max_retries = s.max_retries
+        self._base_url = s.base_url.rstrip("/")
+        self._token_url = f"{self._base_url.rsplit('/pms', 1)[0]}/oauth/token"
         self._access_token: str | None = None
+        self._token_refresh_at: float = 0.0
+        self._token_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.settings.max_parallel_requests)
+        self._inflight: dict[tuple[Any, ...], asyncio.Task[dict[str, Any]]] = {}
+        self._read_cache: TTLCache[tuple[Any, ...], dict[str, Any]] | None = (
+            TTLCache(
+                maxsize=self.settings.read_cache_maxsize,
+                ttl=self.settings.read_cache_ttl_seconds,
+            )
+            if self.settings.read_cache_ttl_seconds > 0
+            else None
+        )
+        # Last ETag-bearing response per lookup, kept past the TTL for revalidation.
+        self._etag_cache: LRUCache[tuple[Any, ...], dict[str, Any]] = LRUCache(
+            maxsize=self.settings.read_cache_maxsize
+        )
+        # Bumped per endpoint on invalidation; a read that started under an
+        # older generation must not repopulate the caches.
+        self._generations: dict[str, int] = {}
+
+    @staticmethod
+    def seed(value: int | None = None) -> None:
+        """Seed the mock data generator for reproducible mock responses."""
+        _rng.seed(value)
 
     async def __aenter__(self) -> "SynXisPMSClient":
-        if not self.settings.mock_mode:
+        if not self._mock:
             await self._ensure_client()
         return self
 
@@ -45,9 +235,10 @@ class SynXisPMSClient:
         await self.close()
 
     async def _ensure_client(self) -> httpx.AsyncClient:
+        if self.settings.reuse_global_client:
+            return await get_shared_client(self.settings)
         if self._client is None:
-            config = self.settings.http_client_config()
-            self._client = httpx.AsyncClient(**config)
+            self._client = _build_http_client(self.settings)
         return self._client
 
     async def close(self) -> None:
@@ -55,13 +246,29 @@ class SynXisPMSClient:
             await self._client.aclose()
             self._client = None
 
-    async def _get_access_token(self) -> str:
-        """Get OAuth2 access token using client credentials flow."""
-        if self._access_token:
+    def _cached_token(self) -> str | None:
+        if self._access_token and time.monotonic() < self._token_refresh_at:
             return self._access_token
+        return None
 
-        if self.settings.mock_mode:
+    async def _get_access_token(self) -> str:
+        """Get OAuth2 access token, refreshing it shortly before it expires."""
+        token = self._cached_token()
+        if token:
+            return token
+
+        async with self._token_lock:
+            # Another task may have refreshed the token while we waited.
+            token = self._cached_token()
+            if token:
+                return token
+            return await self._request_access_token()
+
+    async def _request_access_token(self) -> str:
+        """Request a new OAuth2 access token using client credentials flow."""
+        if self._mock:
             self._access_token = "mock_access_token_12345"
+            self._token_refresh_at = float("inf")
             return self._access_token
 
         if not self.settings.has_credentials():
@@ -71,11 +278,10 @@ class SynXisPMSClient:
             )
 
         client = await self._ensure_client()
-        token_url = f"{self.settings.base_url.rsplit('/pms', 1)[0]}/oauth/token"
 
         try:
             response = await client.post(
-                token_url,
+                self._token_url,
                 data={
                     "grant_type": "client_credentials",
                     "client_id": self.settings.client_id,
@@ -90,13 +296,19 @@ class SynXisPMSClient:
 
             response.raise_for_status()
             token_data = response.json()
-            self._access_token = token_data.get("access_token")
+            access_token = token_data.get("access_token")
 
-            if not self._access_token:
+            if not access_token:
                 raise SynXisPMSError(message="No access token in OAuth2 response", status=500)
 
+            self._access_token = access_token
+            lifetime = float(token_data.get("expires_in") or _DEFAULT_TOKEN_LIFETIME)
+            # Refresh ahead of expiry, but never so early that a short-lived
+            # token is stale on arrival and every request re-authenticates.
+            margin = min(_TOKEN_REFRESH_MARGIN, lifetime / 2)
+            self._token_refresh_at = time.monotonic() + lifetime - margin
             logger.info("OAuth2 token obtained successfully")
-            return self._access_token
+            return access_token
 
         except httpx.HTTPStatusError as e:
             logger.error("OAuth2 token request failed", status=e.response.status_code)
@@ -114,24 +326,128 @@ class SynXisPMSClient:
         endpoint: str,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Make an authenticated API request with retry logic."""
-        import asyncio
-
+        """Make an authenticated API request, coalescing identical GETs.
+
+        Concurrent GETs for the same endpoint, params and If-None-Match share
+        one in-flight request, which a cancelled caller does not cancel for the others;
+        other methods are always sent individually.
+        """
+        if method != "GET":
+            return await self._send_authenticated_request(method, endpoint, **kwargs)
+
+        # The validator is part of the key: a conditional GET may come back as
+        # a bodiless 304 that only a caller holding the same ETag can use.
+        key = (
+            method,
+            endpoint,
+            tuple(sorted(kwargs.get("params", {}).items())),
+            kwargs.get("headers", {}).get("If-None-Match"),
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            # The request runs as its own task so no single caller owns it:
+            # cancelling one waiter leaves the others (and the request) alive.
+            task = asyncio.create_task(
+                self._send_authenticated_request(method, endpoint, **kwargs)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        return await asyncio.shield(task)
+
+    def _request_done(
+        self, key: tuple[Any, ...], task: asyncio.Task[dict[str, Any]]
+    ) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved: if every waiter was cancelled nobody else will.
+            task.exception()
+
+    async def _cached_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        *,
+        fresh: bool = False,
+    ) -> dict[str, Any]:
+        """GET a read-only resource, serving repeats from the read caches.
+
+        Fresh entries come straight from the TTL cache. Once an entry expires,
+        the last response's ETag is sent as If-None-Match so an unchanged
+        resource costs a bodiless 304 instead of a full payload. ``fresh``
+        skips the TTL cache and always asks the API (still revalidating).
+        """
+        key = (endpoint, tuple(sorted(params.items())))
+        if self._read_cache is not None and not fresh:
+            cached = self._read_cache.get(key)
+            if cached is not None:
+                return cached
+
+        generation = self._generations.get(endpoint, 0)
+        validated = self._etag_cache.get(key)
+        headers = {"If-None-Match": validated["etag"]} if validated else {}
+        result = await self._make_authenticated_request(
+            "GET", endpoint, params=params, headers=headers
+        )
+        if result.get("status") == "not_modified" and validated is not None:
+            result = validated
+
+        if (
+            result.get("status") == "success"
+            and self._generations.get(endpoint, 0) == generation
+        ):
+            if self._read_cache is not None:
+                self._read_cache[key] = result
+            if result.get("etag"):
+                self._etag_cache[key] = result
+        return result
+
+    def _invalidate_room(self, room_id: str | None) -> None:
+        """Drop cached and in-flight lookups for a room whose state has changed."""
+        if not room_id:
+            return
+        endpoints = {f"/rooms/{room_id}", f"/rooms/{room_id}/status"}
+        for endpoint in endpoints:
+            self._generations[endpoint] = self._generations.get(endpoint, 0) + 1
+        for cache in (self._read_cache, self._etag_cache):
+            if cache is None:
+                continue
+            for key in [k for k in cache if k[0] in endpoints]:
+                cache.pop(key, None)
+        # Reads already in flight predate the write: later callers must not
+        # join them. Their own waiters still get the (older) result.
+        for key in [k for k in self._inflight if k[1] in endpoints]:
+            del self._inflight[key]
+
+    async def _send_authenticated_request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send an authenticated API request with retry logic."""
         client = await self._ensure_client()
         token = await self._get_access_token()
 
         headers = kwargs.pop("headers", {})
         headers["Authorization"] = f"Bearer {token}"
+        if "json" in kwargs:
+            # Encode once with orjson rather than httpx's stdlib json per attempt.
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            headers["Content-Type"] = "application/json"
 
-        url = f"{self.settings.base_url}{endpoint}"
+        url = f"{self._base_url}{endpoint}"
 
-        for attempt in range(self.settings.max_retries):
+        for attempt in range(self._max_retries):
             try:
                 response = await client.request(method, url, headers=headers, **kwargs)
 
                 # Handle token expiration
                 if response.status_code == 401:
-                    self._access_token = None
+                    # Only drop the token we used; a concurrent caller may
+                    # already have replaced it with a fresh one.
+                    if self._access_token == token:
+                        self._access_token = None
                     token = await self._get_access_token()
                     headers["Authorization"] = f"Bearer {token}"
                     response = await client.request(method, url, headers=headers, **kwargs)
@@ -139,30 +455,36 @@ class SynXisPMSClient:
                 if response.status_code == 404:
                     return {"data": None, "status": "not_found"}
 
+                if response.status_code == 304:
+                    return {"data": None, "status": "not_modified"}
+
                 response.raise_for_status()
 
-                data = response.json()
-                return {"data": data, "status": "success"}
+                # Decode the raw bytes directly; empty bodies (e.g. 204) map to {}.
+                raw = response.content
+                data = orjson.loads(raw) if raw else {}
+                return {
+                    "data": data,
+                    "status": "success",
+                    "etag": response.headers.get("ETag"),
+                }
 
             except httpx.HTTPStatusError as e:
-                if attempt < self.settings.max_retries - 1:
-                    await asyncio.sleep(2**attempt)
+                # Only transient failures are worth another attempt; anything
+                # else (400, 403, 422, ...) surfaces immediately.
+                if (
+                    e.response.status_code in _RETRYABLE_STATUS_CODES
+                    and attempt < self._max_retries - 1
+                ):
+                    # Retried attempts never decode the error body.
+                    await asyncio.sleep(_retry_delay(attempt, e.response))
                     continue
 
-                error_body = {}
-                try:
-                    error_body = e.response.json()
-                except Exception:
-                    error_body = {"message": e.response.text}
-
-                raise SynXisPMSError(
-                    message=error_body.get("message", f"API error: {e.response.status_code}"),
-                    status=e.response.status_code,
-                ) from e
+                raise _error_from_response(e.response) from e
 
             except httpx.RequestError as e:
-                if attempt < self.settings.max_retries - 1:
-                    await asyncio.sleep(2**attempt)
+                if attempt < self._max_retries - 1:
+                    await asyncio.sleep(_backoff_delay(attempt))
                     continue
 
                 raise SynXisPMSError(message=f"Request failed: {e}", status=503) from e
@@ -173,51 +495,48 @@ class SynXisPMSClient:
     # Mock Data Generation
     # =========================================================================
 
+    # Mock records are cloned from prebuilt templates so only the varying
+    # fields are set per call; list fields are copied to keep templates intact.
+
     def _mock_guest(self, guest_id: str) -> Guest:
-        return Guest(
-            guest_id=guest_id,
-            first_name="John",
-            last_name="Doe",
-            email="john.doe@example.com",
-            phone="+1-555-0100",
-            address="123 Main Street",
-            city="New York",
-            country="US",
-            loyalty_tier="Gold",
-            vip_status=random.random() > 0.8,
-            preferences=["High floor", "Non-smoking"],
+        return _MOCK_GUEST_TEMPLATE.model_copy(
+            update={
+                "guest_id": guest_id,
+                "vip_status": _rng.random() > 0.8,
+                "preferences": list(_MOCK_GUEST_PREFERENCES),
+            }
         )
 
     def _mock_room(self, room_id: str) -> Room:
-        room_num = f"{random.randint(1, 10)}{random.randint(1, 20):02d}"
-        return Room(
-            room_id=room_id,
-            room_number=room_num,
-            room_type="DLX",
-            room_type_name="Deluxe Room",
-            floor=int(room_num[:1]),
-            status=random.choice(list(RoomStatus)),
-            features=["WiFi", "Mini Bar", "Safe", "Iron"],
-            max_occupancy=2,
-            current_occupancy=random.randint(0, 2),
+        room_num = f"{_rng.randint(1, 10)}{_rng.randint(1, 20):02d}"
+        return _MOCK_ROOM_TEMPLATE.model_copy(
+            update={
+                "room_id": room_id,
+                "room_number": room_num,
+                "floor": int(room_num[:1]),
+                "status": _rng.choice(_ROOM_STATUSES),
+                "features": list(_MOCK_ROOM_FEATURES),
+                "current_occupancy": _rng.randint(0, 2),
+            }
         )
 
     # =========================================================================
     # Public API Methods
     # =========================================================================
 
-    async def get_guest(self, guest_id: str) -> Guest | None:
-        """Get guest information."""
-        logger.info("Getting guest", guest_id=guest_id, mock_mode=self.settings.mock_mode)
+    async def get_guest(self, guest_id: str, *, fresh: bool = False) -> Guest | None:
+        """Get guest information; ``fresh`` bypasses the read cache."""
+        if is_log_enabled(logger, logging.DEBUG):
+            logger.debug("Getting guest", guest_id=guest_id, mock_mode=self._mock)
 
-        if self.settings.mock_mode:
+        if self._mock:
             return self._mock_guest(guest_id)
 
         # Real API implementation
-        result = await self._make_authenticated_request(
-            "GET",
+        result = await self._cached_get(
             f"/guests/{guest_id}",
-            params={"propertyId": self.settings.property_id},
+            params={"propertyId": self._property_id},
+            fresh=fresh,
         )
 
         data = result.get("data")
@@ -239,18 +558,19 @@ class SynXisPMSClient:
             preferences=guest_data.get("preferences", []),
         )
 
-    async def get_room(self, room_id: str) -> Room | None:
-        """Get room information."""
-        logger.info("Getting room", room_id=room_id, mock_mode=self.settings.mock_mode)
+    async def get_room(self, room_id: str, *, fresh: bool = False) -> Room | None:
+        """Get room information; ``fresh`` bypasses the read cache."""
+        if is_log_enabled(logger, logging.DEBUG):
+            logger.debug("Getting room", room_id=room_id, mock_mode=self._mock)
 
-        if self.settings.mock_mode:
+        if self._mock:
             return self._mock_room(room_id)
 
         # Real API implementation
-        result = await self._make_authenticated_request(
-            "GET",
+        result = await self._cached_get(
             f"/rooms/{room_id}",
-            params={"propertyId": self.settings.property_id},
+            params={"propertyId": self._property_id},
+            fresh=fresh,
         )
 
         data = result.get("data")
@@ -270,33 +590,67 @@ class SynXisPMSClient:
             current_occupancy=room_data.get("currentOccupancy", 0),
         )
 
-    async def get_room_status(self, room_id: str) -> RoomStatus:
-        """Get current room status."""
-        logger.info("Getting room status", room_id=room_id)
+    async def get_room_status(self, room_id: str, *, fresh: bool = False) -> RoomStatus:
+        """Get current room status; ``fresh`` bypasses the read cache."""
+        if is_log_enabled(logger, logging.DEBUG):
+            logger.debug("Getting room status", room_id=room_id)
 
-        if self.settings.mock_mode:
+        if self._mock:
             room = self._mock_room(room_id)
             return room.status
 
         # Real API implementation
-        result = await self._make_authenticated_request(
-            "GET",
+        result = await self._cached_get(
             f"/rooms/{room_id}/status",
-            params={"propertyId": self.settings.property_id},
+            params={"propertyId": self._property_id},
+            fresh=fresh,
         )
 
-        data = result.get("data", {})
+        data = result.get("data") or {}
         return RoomStatus(data.get("status", "clean"))
 
+    async def gather_limited(
+        self,
+        fetch: Callable[[str], Awaitable[T]],
+        ids: Iterable[str],
+    ) -> dict[str, T]:
+        """Run ``fetch`` once per distinct id, capped by max_parallel_requests.
+
+        Results are keyed by id in first-seen order. Every batch lookup, here
+        and in the tool layer, shares this client's concurrency limit.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+
+        async def one(item_id: str) -> T:
+            async with self._semaphore:
+                return await fetch(item_id)
+
+        results = await asyncio.gather(*(one(item_id) for item_id in unique_ids))
+        return dict(zip(unique_ids, results, strict=True))
+
+    async def get_guests(self, guest_ids: Iterable[str]) -> list[Guest | None]:
+        """Get several guests concurrently, in the order requested."""
+        guest_ids = list(guest_ids)
+        guests = await self.gather_limited(self.get_guest, guest_ids)
+        return [guests[guest_id] for guest_id in guest_ids]
+
+    async def get_rooms(self, room_ids: Iterable[str]) -> list[Room | None]:
+        """Get several rooms concurrently, in the order requested."""
+        room_ids = list(room_ids)
+        rooms = await self.gather_limited(self.get_room, room_ids)
+        return [rooms[room_id] for room_id in room_ids]
+
     async def list_available_rooms(self) -> list[Room]:
         """List all available rooms."""
-        logger.info("Listing available rooms")
+        logger.debug("Listing available rooms")
 
-        if self.settings.mock_mode:
+        if self._mock:
+            # Draw how many of the 10 mock rooms are available (p=0.7 each),
+            # then pick which ones, instead of one PRNG call per room.
+            count = _rng.binomialvariate(10, 0.7)
             return [
                 self._mock_room(f"ROOM{i:03d}")
-                for i in range(1, 11)
-                if random.random() > 0.3
+                for i in sorted(_rng.sample(range(1, 11), count))
             ]
 
         # Real API implementation
@@ -304,27 +658,29 @@ class SynXisPMSClient:
             "GET",
             "/rooms",
             params={
-                "propertyId": self.settings.property_id,
+                "propertyId": self._property_id,
                 "status": "available",
             },
         )
 
         rooms_data = result.get("data", {}).get("rooms", [])
-        rooms = []
-        for room_data in rooms_data:
-            rooms.append(Room(
+        # Hoisted so the comprehension does plain local lookups per row.
+        room = Room
+        room_status = RoomStatus
+        return [
+            room(
                 room_id=room_data.get("roomId"),
                 room_number=room_data.get("roomNumber"),
                 room_type=room_data.get("roomType"),
                 room_type_name=room_data.get("roomTypeName"),
                 floor=room_data.get("floor"),
-                status=RoomStatus(room_data.get("status", "clean")),
+                status=room_status(room_data.get("status", "clean")),
                 features=room_data.get("features", []),
                 max_occupancy=room_data.get("maxOccupancy", 2),
                 current_occupancy=room_data.get("currentOccupancy", 0),
-            ))
-
-        return rooms
+            )
+            for room_data in rooms_data
+        ]
 
     async def check_in(
         self,
@@ -332,18 +688,19 @@ class SynXisPMSClient:
         room_id: str,
     ) -> CheckInResult:
         """Check in a guest."""
-        logger.info(
-            "Checking in guest",
-            reservation_id=reservation_id,
-            room_id=room_id,
-        )
+        if is_log_enabled(logger):
+            logger.info(
+                "Checking in guest",
+                reservation_id=reservation_id,
+                room_id=room_id,
+            )
 
-        if self.settings.mock_mode:
+        if self._mock:
             return CheckInResult(
                 success=True,
                 reservation_id=reservation_id,
                 room_id=room_id,
-                room_number=f"{random.randint(1, 10)}{random.randint(1, 20):02d}",
+                room_number=f"{_rng.randint(1, 10)}{_rng.randint(1, 20):02d}",
                 guest_name="John Doe",
                 check_in_time=datetime.now(),
                 key_cards_issued=2,
@@ -356,10 +713,11 @@ class SynXisPMSClient:
             f"/reservations/{reservation_id}/checkin",
             json={
                 "roomId": room_id,
-                "propertyId": self.settings.property_id,
+                "propertyId": self._property_id,
             },
         )
 
+        self._invalidate_room(room_id)
         data = result.get("data", {}).get("checkIn", {})
 
         return CheckInResult(
@@ -369,7 +727,7 @@ class SynXisPMSClient:
             room_number=data.get("roomNumber"),
             guest_name=data.get("guestName"),
             check_in_time=(
-                datetime.fromisoformat(data["checkInTime"])
+                _parse_datetime(data["checkInTime"])
                 if data.get("checkInTime")
                 else datetime.now()
             ),
@@ -379,11 +737,12 @@ class SynXisPMSClient:
 
     async def check_out(self, reservation_id: str) -> CheckOutResult:
         """Check out a guest."""
-        logger.info("Checking out guest", reservation_id=reservation_id)
+        if is_log_enabled(logger):
+            logger.info("Checking out guest", reservation_id=reservation_id)
 
-        if self.settings.mock_mode:
-            total = random.uniform(200.0, 800.0)
-            paid = total * random.uniform(0.5, 1.0)
+        if self._mock:
+            total = _rng.uniform(200.0, 800.0)
+            paid = total * _rng.uniform(0.5, 1.0)
             return CheckOutResult(
                 success=True,
                 reservation_id=reservation_id,
@@ -394,17 +753,18 @@ class SynXisPMSClient:
                 total_charges=round(total, 2),
                 payments_received=round(paid, 2),
                 balance_due=round(total - paid, 2),
-                invoice_number=f"INV-{random.randint(10000, 99999)}",
+                invoice_number=f"INV-{_rng.randint(10000, 99999)}",
             )
 
         # Real API implementation
         result = await self._make_authenticated_request(
             "POST",
             f"/reservations/{reservation_id}/checkout",
-            json={"propertyId": self.settings.property_id},
+            json={"propertyId": self._property_id},
         )
 
         data = result.get("data", {}).get("checkOut", {})
+        self._invalidate_room(data.get("roomId"))
 
         return CheckOutResult(
             success=data.get("success", True),
@@ -413,7 +773,7 @@ class SynXisPMSClient:
             room_number=data.get("roomNumber"),
             guest_name=data.get("guestName"),
             check_out_time=(
-                datetime.fromisoformat(data["checkOutTime"])
+                _parse_datetime(data["checkOutTime"])
                 if data.get("checkOutTime")
                 else datetime.now()
             ),
@@ -425,31 +785,31 @@ class SynXisPMSClient:
 
     async def get_folio(self, reservation_id: str) -> Folio:
         """Get guest folio (bill)."""
-        logger.info("Getting folio", reservation_id=reservation_id)
+        if is_log_enabled(logger, logging.DEBUG):
+            logger.debug("Getting folio", reservation_id=reservation_id)
 
-        if self.settings.mock_mode:
+        if self._mock:
+            now = datetime.now()
             charges = [
                 Charge(
                     charge_id=f"CHG{i:03d}",
                     reservation_id=reservation_id,
                     description="Room Charge",
-                    amount=199.99,
+                    amount=_MOCK_CHARGE_AMOUNT,
                     category="ROOM",
-                    posted_at=datetime.now(),
+                    posted_at=now,
                 )
-                for i in range(3)
+                for i in range(_MOCK_CHARGE_COUNT)
             ]
             payments = [
                 Payment(
                     payment_id="PAY001",
                     reservation_id=reservation_id,
-                    amount=200.00,
+                    amount=_MOCK_PAYMENT_AMOUNT,
                     method=PaymentMethod.CREDIT_CARD,
-                    processed_at=datetime.now(),
+                    processed_at=now,
                 )
             ]
-            total_charges = sum(c.amount for c in charges)
-            total_payments = sum(p.amount for p in payments)
 
             return Folio(
                 folio_id=f"FOLIO-{reservation_id}",
@@ -458,48 +818,55 @@ class SynXisPMSClient:
                 room_number="305",
                 charges=charges,
                 payments=payments,
-                total_charges=round(total_charges, 2),
-                total_payments=round(total_payments, 2),
-                balance=round(total_charges - total_payments, 2),
+                total_charges=_MOCK_FOLIO_CHARGES,
+                total_payments=_MOCK_PAYMENT_AMOUNT,
+                balance=_MOCK_FOLIO_BALANCE,
             )
 
         # Real API implementation
         result = await self._make_authenticated_request(
             "GET",
             f"/reservations/{reservation_id}/folio",
-            params={"propertyId": self.settings.property_id},
+            params={"propertyId": self._property_id},
         )
 
         data = result.get("data", {}).get("folio", {})
 
-        charges = []
-        for charge_data in data.get("charges", []):
-            charges.append(Charge(
-                charge_id=charge_data.get("chargeId"),
-                reservation_id=reservation_id,
-                description=charge_data.get("description"),
-                amount=charge_data.get("amount"),
-                category=charge_data.get("category"),
-                posted_at=(
-                    datetime.fromisoformat(charge_data["postedAt"])
-                    if charge_data.get("postedAt")
-                    else datetime.now()
-                ),
-            ))
-
-        payments = []
-        for payment_data in data.get("payments", []):
-            payments.append(Payment(
-                payment_id=payment_data.get("paymentId"),
-                reservation_id=reservation_id,
-                amount=payment_data.get("amount"),
-                method=PaymentMethod(payment_data.get("method", "credit_card")),
-                processed_at=(
-                    datetime.fromisoformat(payment_data["processedAt"])
-                    if payment_data.get("processedAt")
-                    else datetime.now()
-                ),
-            ))
+        now = datetime.now()
+        # Validate each list in one adapter call rather than model by model.
+        charges = CHARGE_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "charge_id": charge_data.get("chargeId"),
+                    "reservation_id": reservation_id,
+                    "description": charge_data.get("description"),
+                    "amount": charge_data.get("amount"),
+                    "category": charge_data.get("category"),
+                    "posted_at": (
+                        _parse_datetime(charge_data["postedAt"])
+                        if charge_data.get("postedAt")
+                        else now
+                    ),
+                }
+                for charge_data in data.get("charges", [])
+            ]
+        )
+        payments = PAYMENT_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "payment_id": payment_data.get("paymentId"),
+                    "reservation_id": reservation_id,
+                    "amount": payment_data.get("amount"),
+                    "method": payment_data.get("method", "credit_card"),
+                    "processed_at": (
+                        _parse_datetime(payment_data["processedAt"])
+                        if payment_data.get("processedAt")
+                        else now
+                    ),
+                }
+                for payment_data in data.get("payments", [])
+            ]
+        )
 
         return Folio(
             folio_id=data.get("folioId"),
@@ -514,4 +881,4 @@ class SynXisPMSClient:
         )
 
 
-__all__ = ["SynXisPMSClient"]
+__all__ = ["SynXisPMSClient", "close_shared_client", "get_shared_client"]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+import logging
+from functools import cache, cached_property
 from typing import Any
 
 import httpx
@@ -15,15 +16,20 @@ try:
     ONEIRIC_LOGGING_AVAILABLE = True
 except ImportError:
     ONEIRIC_LOGGING_AVAILABLE = False
-    import logging
 
-    def get_logger(name: str) -> logging.Logger:
-        return logging.getLogger(name)
+    get_logger = logging.getLogger
 
     def configure_logging(*args: Any, **kwargs: Any) -> None:
         logging.basicConfig(level=logging.INFO)
 
 
+_DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "User-Agent": "synxis-pms-mcp/0.1.1",
+}
+
+
 class SynXisPMSSettings(BaseSettings):
     """Settings for SynXis PMS MCP server."""
 
@@ -32,6 +38,8 @@ class SynXisPMSSettings(BaseSettings):
         env_file=(".env",),
         extra="ignore",
         case_sensitive=False,
+        frozen=True,
+        validate_assignment=False,
     )
 
     # OAuth2 credentials
@@ -47,6 +55,38 @@ class SynXisPMSSettings(BaseSettings):
     timeout: float = Field(default=30.0, ge=1.0, le=120.0)
     max_retries: int = Field(default=3, ge=0, le=5)
 
+    # Connection pool
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum concurrent connections in the HTTP pool",
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum idle keep-alive connections retained in the pool",
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Seconds an idle keep-alive connection is kept open",
+    )
+    http2: bool = Field(default=True, description="Negotiate HTTP/2 with the API")
+    max_parallel_requests: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum concurrent API requests issued by batch lookups",
+    )
+    reuse_global_client: bool = Field(
+        default=True,
+        description="Share one process-wide HTTP client across client instances",
+    )
+
+    # Read cache for guest/room lookups (a TTL of 0 disables it; ETag
+    # revalidation of previously seen resources still applies)
+    read_cache_ttl_seconds: float = Field(default=30.0, ge=0.0)
+    read_cache_maxsize: int = Field(default=1024, ge=1)
+
     # Mock mode
     mock_mode: bool = Field(default=False, description="Use mock data")
 
@@ -64,6 +104,16 @@ class SynXisPMSSettings(BaseSettings):
     def validate_base_url(cls, v: str) -> str:
         return v.rstrip("/") if v else "https://api.synxis.com/pms/v1"
 
+    @field_validator("log_level", mode="after")
+    @classmethod
+    def validate_log_level(cls, v: str) -> str:
+        return v.upper()
+
+    @cached_property
+    def log_level_int(self) -> int:
+        """Numeric logging level for ``log_level``, resolved once."""
+        return getattr(logging, self.log_level, logging.INFO)
+
     def has_credentials(self) -> bool:
         return bool(self.client_id and self.client_secret)
 
@@ -72,15 +122,13 @@ class SynXisPMSSettings(BaseSettings):
             return "***"
         return f"...{self.client_id[-4:]}" if len(self.client_id) > 4 else "***"
 
+    @cached_property
     def http_client_config(self) -> dict[str, Any]:
+        """httpx.AsyncClient keyword arguments, built once per settings instance."""
         return {
             "base_url": self.base_url,
             "timeout": httpx.Timeout(self.timeout),
-            "headers": {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": "synxis-pms-mcp/0.1.1",
-            },
+            "headers": _DEFAULT_HEADERS,
         }
 
 
@@ -97,20 +145,28 @@ def setup_logging(settings: SynXisPMSSettings | None = None) -> None:
         configure_logging(config)
     else:
         logging.basicConfig(
-            level=getattr(logging, settings.log_level.upper(), logging.INFO),
+            level=settings.log_level_int,
             format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         )
 
 
-@lru_cache
+@cache
 def get_settings() -> SynXisPMSSettings:
     return SynXisPMSSettings()
 
 
 def get_logger_instance(name: str = "synxis-pms-mcp") -> Any:
+    return get_logger(name)
+
+
+def is_log_enabled(logger: Any, level: int = logging.INFO) -> bool:
+    """Return whether ``logger`` would emit at ``level``.
+
+    Lets hot paths skip building log kwargs when the record would be dropped.
+    """
     if ONEIRIC_LOGGING_AVAILABLE:
-        return get_logger(name)
-    return logging.getLogger(name)
+        return logger.is_enabled_for(level)
+    return logger.isEnabledFor(level)
 
 
 __all__ = [
@@ -118,4 +174,5 @@ __all__ = [
     "get_settings",
     "setup_logging",
     "get_logger_instance",
+    "is_log_enabled",
 ]
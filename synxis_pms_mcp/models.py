@@ -12,13 +12,13 @@ API Documentation: https://developer.synxis.com/
 from __future__ import annotations
 
 from datetime import date, datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
-class RoomStatus(str, Enum):
+class RoomStatus(StrEnum):
     """Room status values."""
 
     AVAILABLE = "AVAILABLE"
@@ -29,7 +29,7 @@ class RoomStatus(str, Enum):
     CLEANING = "CLEANING"
 
 
-class GuestStatus(str, Enum):
+class GuestStatus(StrEnum):
     """Guest status values."""
 
     RESERVATION = "RESERVATION"
@@ -39,7 +39,7 @@ class GuestStatus(str, Enum):
     NO_SHOW = "NO_SHOW"
 
 
-class PaymentMethod(str, Enum):
+class PaymentMethod(StrEnum):
     """Payment method types."""
 
     CREDIT_CARD = "CREDIT_CARD"
@@ -52,6 +52,8 @@ class PaymentMethod(str, Enum):
 class Guest(BaseModel):
     """Guest information."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     guest_id: str = Field(description="Unique guest identifier")
     first_name: str = Field(description="First name")
     last_name: str = Field(description="Last name")
@@ -72,6 +74,8 @@ class Guest(BaseModel):
 class Room(BaseModel):
     """Room information."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     room_id: str = Field(description="Unique room identifier")
     room_number: str = Field(description="Room number")
     room_type: str = Field(description="Room type code")
@@ -89,6 +93,8 @@ class Room(BaseModel):
 class RoomAssignment(BaseModel):
     """Room assignment details."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     reservation_id: str = Field(description="Reservation identifier")
     room_id: str = Field(description="Assigned room ID")
     room_number: str = Field(description="Room number")
@@ -102,6 +108,8 @@ class RoomAssignment(BaseModel):
 class CheckInResult(BaseModel):
     """Result of check-in operation."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     success: bool = Field(description="Whether check-in succeeded")
     reservation_id: str = Field(description="Reservation identifier")
     room_id: str = Field(description="Assigned room ID")
@@ -115,6 +123,8 @@ class CheckInResult(BaseModel):
 class CheckOutResult(BaseModel):
     """Result of check-out operation."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     success: bool = Field(description="Whether check-out succeeded")
     reservation_id: str = Field(description="Reservation identifier")
     room_id: str = Field(description="Room ID")
@@ -130,6 +140,8 @@ class CheckOutResult(BaseModel):
 class Charge(BaseModel):
     """A charge or posting."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     charge_id: str = Field(description="Charge identifier")
     reservation_id: str = Field(description="Associated reservation")
     description: str = Field(description="Charge description")
@@ -143,6 +155,8 @@ class Charge(BaseModel):
 class Payment(BaseModel):
     """A payment record."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     payment_id: str = Field(description="Payment identifier")
     reservation_id: str = Field(description="Associated reservation")
     amount: float = Field(description="Payment amount", ge=0)
@@ -155,6 +169,8 @@ class Payment(BaseModel):
 class Folio(BaseModel):
     """Guest folio (bill)."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     folio_id: str = Field(description="Folio identifier")
     reservation_id: str = Field(description="Associated reservation")
     guest_name: str = Field(description="Guest name")
@@ -166,6 +182,11 @@ class Folio(BaseModel):
     balance: float = Field(default=0.0, description="Balance due")
 
 
+# Prebuilt validators for the per-row lists in folio responses.
+CHARGE_LIST_ADAPTER = TypeAdapter(list[Charge])
+PAYMENT_LIST_ADAPTER = TypeAdapter(list[Payment])
+
+
 class SynXisPMSError(Exception):
     """Exception raised for SynXis PMS API errors."""
 
@@ -203,5 +224,7 @@ __all__ = [
     "Charge",
     "Payment",
     "Folio",
+    "CHARGE_LIST_ADAPTER",
+    "PAYMENT_LIST_ADAPTER",
     "SynXisPMSError",
 ]
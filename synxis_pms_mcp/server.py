@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, cast
 
 from fastmcp import FastMCP
 
 from synxis_pms_mcp import __version__
-from synxis_pms_mcp.client import SynXisPMSClient
-from synxis_pms_mcp.config import get_logger_instance, get_settings, setup_logging
+from synxis_pms_mcp.client import SynXisPMSClient, close_shared_client
+from synxis_pms_mcp.config import (
+    SynXisPMSSettings,
+    get_logger_instance,
+    get_settings,
+    setup_logging,
+)
 from synxis_pms_mcp.tools import register_pms_tools
 
 if TYPE_CHECKING:
@@ -21,6 +27,27 @@ APP_NAME = "synxis-pms-mcp"
 APP_VERSION = __version__
 
 
+class _LazyClient:
+    """Proxy that builds the SynXisPMSClient on first use by a tool.
+
+    ``settings`` is available up front so tool registration never forces
+    construction; ``close`` is a no-op if the client was never built.
+    """
+
+    def __init__(self, settings: SynXisPMSSettings) -> None:
+        self.settings = settings
+        self._client: SynXisPMSClient | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._client is None:
+            self._client = SynXisPMSClient(self.settings)
+        return getattr(self._client, name)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+
+
 def create_app() -> FastMCP:
     settings = get_settings()
     setup_logging(settings)
@@ -32,8 +59,8 @@ def create_app() -> FastMCP:
     )
 
     app = FastMCP(name=APP_NAME, version=APP_VERSION)
-    client = SynXisPMSClient(settings)
-    register_pms_tools(app, client)
+    client = _LazyClient(settings)
+    register_pms_tools(app, cast("SynXisPMSClient", client))
 
     original_lifespan = app._mcp_server.lifespan
 
@@ -44,27 +71,31 @@ def create_app() -> FastMCP:
                 yield state
             finally:
                 await client.close()
+                await close_shared_client()
 
     app._mcp_server.lifespan = lifespan
     return app
 
 
-_app: FastMCP | None = None
+@cache
+def get_app() -> FastMCP:
+    return create_app()
 
 
-def get_app() -> FastMCP:
-    global _app
-    if _app is None:
-        _app = create_app()
-    return _app
+@cache
+def _http_app() -> Any:
+    return get_app().http_app
 
 
 def __getattr__(name: str) -> Any:
     if name == "app":
-        return get_app()
-    if name == "http_app":
-        return get_app().http_app
-    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+        value = get_app()
+    elif name == "http_app":
+        value = _http_app()
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()[name] = value
+    return value
 
 
 __all__ = ["create_app", "get_app", "APP_NAME", "APP_VERSION"]
@@ -1,21 +1,21 @@
 """PMS management MCP tools.
 
 Tools for SynXis Property Management System:
-- get_guest: Retrieve guest information
-- get_room_status: Check room status
+- get_guest / get_guests: Retrieve guest information
+- get_room_status / get_room_statuses: Check room status
 - check_in: Check in a guest
 - check_out: Check out a guest
-- get_folio: Get guest billing
+- get_folio / get_folios: Get guest billing
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from synxis_pms_mcp.client import SynXisPMSClient
-from synxis_pms_mcp.config import get_logger_instance
+from synxis_pms_mcp.config import get_logger_instance, is_log_enabled
 from synxis_pms_mcp.models import CheckInResult, CheckOutResult, Folio, Guest, Room
 
 if TYPE_CHECKING:
@@ -27,11 +27,56 @@ logger = get_logger_instance("synxis-pms-mcp.tools")
 class ToolResponse(BaseModel):
     """Standardized tool response."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     message: str
     data: dict[str, Any] | None = None
     error: str | None = None
-    next_steps: list[str] | None = None
+    next_steps: tuple[str, ...] | None = None
+
+
+# Shared, immutable hint lists reused by every response.
+_GUEST_NOT_FOUND_NEXT: Final[tuple[str, ...]] = ("Verify the guest ID is correct",)
+_GET_GUEST_NEXT: Final[tuple[str, ...]] = (
+    "Use check_in to check in the guest",
+    "Use get_folio to view billing",
+)
+_ROOM_STATUS_NEXT: Final[tuple[str, ...]] = (
+    "Use check_in if room is available",
+    "Use check_out if room is occupied",
+)
+_CHECK_IN_NEXT: Final[tuple[str, ...]] = (
+    "Issue key cards to guest",
+    "Inform guest of amenities",
+    "Use get_folio to track charges",
+)
+_CHECK_OUT_NEXT: Final[tuple[str, ...]] = (
+    "Process any remaining balance",
+    "Return key cards",
+    "Mark room for cleaning",
+)
+_FOLIO_NEXT: Final[tuple[str, ...]] = (
+    "Review charges with guest",
+    "Process payment if balance due",
+    "Print invoice",
+)
+
+# Timestamps are emitted as ISO 8601 strings by the JSON-mode dump.
+_CHECK_IN_FIELDS = frozenset(
+    {"reservation_id", "room_number", "check_in_time", "key_cards_issued"}
+)
+_CHECK_OUT_FIELDS = frozenset(
+    {
+        "reservation_id",
+        "room_number",
+        "check_out_time",
+        "total_charges",
+        "payments_received",
+        "balance_due",
+        "invoice_number",
+    }
+)
 
 
 def _guest_to_dict(guest: Guest) -> dict[str, Any]:
@@ -61,38 +106,37 @@ def _room_to_dict(room: Room) -> dict[str, Any]:
     }
 
 
-def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
-    """Register PMS management tools."""
-
-    @app.tool()
-    async def get_guest(guest_id: str) -> ToolResponse:
-        """Get guest information by ID.
+def _batch_response(noun: str, results: dict[str, ToolResponse]) -> ToolResponse:
+    succeeded = sum(response.success for response in results.values())
+    return ToolResponse(
+        success=succeeded == len(results),
+        message=f"Retrieved {succeeded} of {len(results)} {noun}",
+        data={
+            "results": {
+                item_id: response.model_dump() for item_id, response in results.items()
+            }
+        },
+    )
 
-        Args:
-            guest_id: Guest identifier
 
-        Returns:
-            Guest details
-        """
-        logger.info("Getting guest", guest_id=guest_id)
+def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
+    """Register PMS management tools."""
 
+    async def guest_response(guest_id: str, fresh: bool = False) -> ToolResponse:
         try:
-            guest = await client.get_guest(guest_id)
+            guest = await client.get_guest(guest_id, fresh=fresh)
             if not guest:
                 return ToolResponse(
                     success=False,
                     message=f"Guest {guest_id} not found",
-                    next_steps=["Verify the guest ID is correct"],
+                    next_steps=_GUEST_NOT_FOUND_NEXT,
                 )
 
             return ToolResponse(
                 success=True,
                 message=f"Found guest: {guest.first_name} {guest.last_name}",
                 data={"guest": _guest_to_dict(guest)},
-                next_steps=[
-                    "Use check_in to check in the guest",
-                    "Use get_folio to view billing",
-                ],
+                next_steps=_GET_GUEST_NEXT,
             )
 
         except Exception as e:
@@ -102,20 +146,9 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
                 error=str(e),
             )
 
-    @app.tool()
-    async def get_room_status(room_id: str) -> ToolResponse:
-        """Get current room status.
-
-        Args:
-            room_id: Room identifier
-
-        Returns:
-            Room status information
-        """
-        logger.info("Getting room status", room_id=room_id)
-
+    async def room_status_response(room_id: str, fresh: bool = False) -> ToolResponse:
         try:
-            room = await client.get_room(room_id)
+            room = await client.get_room(room_id, fresh=fresh)
             if not room:
                 return ToolResponse(
                     success=False,
@@ -124,12 +157,9 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
 
             return ToolResponse(
                 success=True,
-                message=f"Room {room.room_number} status: {room.status.value}",
+                message=f"Room {room.room_number} status: {room.status}",
                 data={"room": _room_to_dict(room)},
-                next_steps=[
-                    "Use check_in if room is available",
-                    "Use check_out if room is occupied",
-                ],
+                next_steps=_ROOM_STATUS_NEXT,
             )
 
         except Exception as e:
@@ -139,6 +169,66 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
                 error=str(e),
             )
 
+    @app.tool()
+    async def get_guest(guest_id: str, fresh: bool = False) -> ToolResponse:
+        """Get guest information by ID.
+
+        Args:
+            guest_id: Guest identifier
+            fresh: Bypass recently cached data and query the PMS directly
+
+        Returns:
+            Guest details
+        """
+        if is_log_enabled(logger):
+            logger.info("Getting guest", guest_id=guest_id)
+        return await guest_response(guest_id, fresh)
+
+    @app.tool()
+    async def get_guests(guest_ids: list[str]) -> ToolResponse:
+        """Get information for several guests in one call.
+
+        Args:
+            guest_ids: Guest identifiers
+
+        Returns:
+            Per-guest results keyed by guest ID
+        """
+        if is_log_enabled(logger):
+            logger.info("Getting guests", count=len(guest_ids))
+        guests = await client.gather_limited(guest_response, guest_ids)
+        return _batch_response("guests", guests)
+
+    @app.tool()
+    async def get_room_status(room_id: str, fresh: bool = False) -> ToolResponse:
+        """Get current room status.
+
+        Args:
+            room_id: Room identifier
+            fresh: Bypass recently cached data and query the PMS directly
+
+        Returns:
+            Room status information
+        """
+        if is_log_enabled(logger):
+            logger.info("Getting room status", room_id=room_id)
+        return await room_status_response(room_id, fresh)
+
+    @app.tool()
+    async def get_room_statuses(room_ids: list[str]) -> ToolResponse:
+        """Get current status for several rooms in one call.
+
+        Args:
+            room_ids: Room identifiers
+
+        Returns:
+            Per-room results keyed by room ID
+        """
+        if is_log_enabled(logger):
+            logger.info("Getting room statuses", count=len(room_ids))
+        rooms = await client.gather_limited(room_status_response, room_ids)
+        return _batch_response("rooms", rooms)
+
     @app.tool()
     async def check_in(
         reservation_id: str,
@@ -153,7 +243,8 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
         Returns:
             Check-in confirmation
         """
-        logger.info("Checking in", reservation_id=reservation_id)
+        if is_log_enabled(logger):
+            logger.info("Checking in", reservation_id=reservation_id)
 
         try:
             result = await client.check_in(reservation_id, room_id)
@@ -161,17 +252,8 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
             return ToolResponse(
                 success=True,
                 message=f"Checked in {result.guest_name} to room {result.room_number}",
-                data={
-                    "reservation_id": result.reservation_id,
-                    "room_number": result.room_number,
-                    "check_in_time": str(result.check_in_time),
-                    "key_cards_issued": result.key_cards_issued,
-                },
-                next_steps=[
-                    "Issue key cards to guest",
-                    "Inform guest of amenities",
-                    "Use get_folio to track charges",
-                ],
+                data=result.model_dump(mode="json", include=_CHECK_IN_FIELDS),
+                next_steps=_CHECK_IN_NEXT,
             )
 
         except Exception as e:
@@ -191,7 +273,8 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
         Returns:
             Check-out confirmation with billing summary
         """
-        logger.info("Checking out", reservation_id=reservation_id)
+        if is_log_enabled(logger):
+            logger.info("Checking out", reservation_id=reservation_id)
 
         try:
             result = await client.check_out(reservation_id)
@@ -199,20 +282,8 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
             return ToolResponse(
                 success=True,
                 message=f"Checked out {result.guest_name} from room {result.room_number}",
-                data={
-                    "reservation_id": result.reservation_id,
-                    "room_number": result.room_number,
-                    "check_out_time": str(result.check_out_time),
-                    "total_charges": result.total_charges,
-                    "payments_received": result.payments_received,
-                    "balance_due": result.balance_due,
-                    "invoice_number": result.invoice_number,
-                },
-                next_steps=[
-                    "Process any remaining balance",
-                    "Return key cards",
-                    "Mark room for cleaning",
-                ],
+                data=result.model_dump(mode="json", include=_CHECK_OUT_FIELDS),
+                next_steps=_CHECK_OUT_NEXT,
             )
 
         except Exception as e:
@@ -222,18 +293,7 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
                 error=str(e),
             )
 
-    @app.tool()
-    async def get_folio(reservation_id: str) -> ToolResponse:
-        """Get guest folio (billing statement).
-
-        Args:
-            reservation_id: Reservation identifier
-
-        Returns:
-            Detailed billing information
-        """
-        logger.info("Getting folio", reservation_id=reservation_id)
-
+    async def folio_response(reservation_id: str) -> ToolResponse:
         try:
             folio = await client.get_folio(reservation_id)
 
@@ -263,11 +323,7 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
                     "total_payments": folio.total_payments,
                     "balance": folio.balance,
                 },
-                next_steps=[
-                    "Review charges with guest",
-                    "Process payment if balance due",
-                    "Print invoice",
-                ],
+                next_steps=_FOLIO_NEXT,
             )
 
         except Exception as e:
@@ -277,4 +333,34 @@ def register_pms_tools(app: "FastMCP", client: SynXisPMSClient) -> None:
                 error=str(e),
             )
 
-    logger.info("Registered 5 PMS management tools")
+    @app.tool()
+    async def get_folio(reservation_id: str) -> ToolResponse:
+        """Get guest folio (billing statement).
+
+        Args:
+            reservation_id: Reservation identifier
+
+        Returns:
+            Detailed billing information
+        """
+        if is_log_enabled(logger):
+            logger.info("Getting folio", reservation_id=reservation_id)
+        return await folio_response(reservation_id)
+
+    @app.tool()
+    async def get_folios(reservation_ids: list[str]) -> ToolResponse:
+        """Get folios (billing statements) for several reservations in one call.
+
+        Args:
+            reservation_ids: Reservation identifiers
+
+        Returns:
+            Per-reservation results keyed by reservation ID
+        """
+        if is_log_enabled(logger):
+            logger.info("Getting folios", count=len(reservation_ids))
+        return _batch_response(
+            "folios", await client.gather_limited(folio_response, reservation_ids)
+        )
+
+    logger.info("Registered 8 PMS management tools")
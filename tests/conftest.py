@@ -0,0 +1,121 @@
+"""Shared fixtures for SynXis PMS client tests."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from synxis_pms_mcp.client import SynXisPMSClient
+from synxis_pms_mcp.config import SynXisPMSSettings
+
+BASE_PATH = "/pms/v1"
+TOKEN_PATH = "/oauth/token"
+
+Route = (
+    httpx.Response
+    | list[httpx.Response]
+    | Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]]
+)
+
+
+class FakePMS:
+    """Scripted SynXis API served through ``httpx.MockTransport``.
+
+    Routes are keyed by path relative to the API base URL. A route may be a
+    single response, a list consumed one response per request, or a sync or
+    async callable taking the request. ``delay`` yields to the event loop
+    before answering so concurrent callers overlap as they would against the
+    real API.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, Route] = {}
+        self.requests: list[httpx.Request] = []
+        self.token_requests = 0
+        self.expires_in: float | None = 3600
+        self.delay = 0.0
+
+    def route(self, path: str, route: Route) -> None:
+        self.routes[path] = route
+
+    def calls(self, path: str) -> list[httpx.Request]:
+        return [r for r in self.requests if r.url.path == f"{BASE_PATH}{path}"]
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        if request.url.path == TOKEN_PATH:
+            self.token_requests += 1
+            token: dict[str, Any] = {"access_token": f"token-{self.token_requests}"}
+            if self.expires_in is not None:
+                token["expires_in"] = self.expires_in
+            return httpx.Response(200, json=token)
+
+        self.requests.append(request)
+        path = request.url.path.removeprefix(BASE_PATH)
+        route = self.routes.get(path)
+        if route is None:
+            return httpx.Response(404)
+        if isinstance(route, list):
+            return route.pop(0)
+        if callable(route):
+            response = route(request)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+        return route
+
+
+@pytest.fixture
+def fake_pms() -> FakePMS:
+    return FakePMS()
+
+
+@pytest.fixture
+async def make_client(
+    fake_pms: FakePMS,
+) -> AsyncIterator[Callable[..., SynXisPMSClient]]:
+    """Build real-mode clients wired to ``fake_pms``; kwargs override settings."""
+    clients: list[SynXisPMSClient] = []
+
+    def factory(**overrides: Any) -> SynXisPMSClient:
+        values: dict[str, Any] = {
+            "client_id": "client",
+            "client_secret": "secret",
+            "property_id": "PROP1",
+            "mock_mode": False,
+            "reuse_global_client": False,
+            **overrides,
+        }
+        client = SynXisPMSClient(SynXisPMSSettings(**values))
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(fake_pms.handler)
+        )
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        await client.close()
+
+
+def guest_payload(guest_id: str, first_name: str = "Jane") -> dict[str, Any]:
+    return {"guest": {"guestId": guest_id, "firstName": first_name, "lastName": "Roe"}}
+
+
+def room_payload(room_id: str, status: str = "AVAILABLE") -> dict[str, Any]:
+    return {
+        "room": {
+            "roomId": room_id,
+            "roomNumber": "101",
+            "roomType": "DLX",
+            "roomTypeName": "Deluxe Room",
+            "status": status,
+        }
+    }
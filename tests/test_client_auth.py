@@ -0,0 +1,104 @@
+"""Tests for OAuth2 token caching in SynXisPMSClient."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from synxis_pms_mcp import client as client_module
+from synxis_pms_mcp.models import SynXisPMSError
+
+from .conftest import guest_payload
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    # Only the client module's clock; the event loop keeps the real one.
+    monkeypatch.setattr(client_module, "time", fake)
+    return fake
+
+
+async def test_token_reused_until_refresh_margin(fake_pms, make_client, clock):
+    fake_pms.route("/guests/G1", httpx.Response(200, json=guest_payload("G1")))
+    client = make_client(read_cache_ttl_seconds=0)
+
+    await client.get_guest("G1")
+    clock.now += 3600 - 61
+    await client.get_guest("G1")
+    assert fake_pms.token_requests == 1
+
+    # Inside the 60s margin before expiry the token is refreshed.
+    clock.now += 2
+    await client.get_guest("G1")
+    assert fake_pms.token_requests == 2
+
+
+async def test_short_lived_token_is_still_cached(fake_pms, make_client, clock):
+    fake_pms.expires_in = 30
+    fake_pms.route("/guests/G1", httpx.Response(200, json=guest_payload("G1")))
+    client = make_client(read_cache_ttl_seconds=0)
+
+    for _ in range(3):
+        await client.get_guest("G1")
+    assert fake_pms.token_requests == 1
+
+    # The margin is capped at half the lifetime.
+    clock.now += 16
+    await client.get_guest("G1")
+    assert fake_pms.token_requests == 2
+
+
+async def test_missing_expires_in_uses_default_lifetime(fake_pms, make_client, clock):
+    fake_pms.expires_in = None
+    client = make_client()
+
+    await client._get_access_token()
+    clock.now += 3000
+    await client._get_access_token()
+    assert fake_pms.token_requests == 1
+
+
+async def test_concurrent_callers_share_one_token_request(fake_pms, make_client):
+    fake_pms.delay = 0.01
+    client = make_client()
+
+    tokens = await asyncio.gather(*(client._get_access_token() for _ in range(5)))
+
+    assert set(tokens) == {"token-1"}
+    assert fake_pms.token_requests == 1
+
+
+async def test_unauthorized_response_refreshes_token(fake_pms, make_client):
+    fake_pms.route(
+        "/guests/G1",
+        [httpx.Response(401), httpx.Response(200, json=guest_payload("G1"))],
+    )
+    client = make_client()
+
+    guest = await client.get_guest("G1")
+
+    assert guest is not None
+    assert fake_pms.token_requests == 2
+    auth = [r.headers["Authorization"] for r in fake_pms.calls("/guests/G1")]
+    assert auth == ["Bearer token-1", "Bearer token-2"]
+
+
+async def test_missing_credentials_raise(make_client):
+    client = make_client(client_id="", client_secret="")
+
+    with pytest.raises(SynXisPMSError) as exc_info:
+        await client._get_access_token()
+    assert exc_info.value.status == 401
@@ -0,0 +1,269 @@
+"""Tests for the read caches behind guest and room lookups."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from synxis_pms_mcp.models import RoomStatus
+
+from .conftest import guest_payload, room_payload
+
+pytestmark = pytest.mark.unit
+
+
+async def test_repeat_lookups_served_from_ttl_cache(fake_pms, make_client):
+    fake_pms.route("/guests/G1", httpx.Response(200, json=guest_payload("G1")))
+    fake_pms.route("/rooms/R1", httpx.Response(200, json=room_payload("R1")))
+    fake_pms.route("/rooms/R1/status", httpx.Response(200, json={"status": "DIRTY"}))
+    client = make_client()
+
+    for _ in range(3):
+        assert (await client.get_guest("G1")).guest_id == "G1"
+        assert (await client.get_room("R1")).room_id == "R1"
+        assert await client.get_room_status("R1") == RoomStatus.DIRTY
+
+    assert len(fake_pms.calls("/guests/G1")) == 1
+    assert len(fake_pms.calls("/rooms/R1")) == 1
+    assert len(fake_pms.calls("/rooms/R1/status")) == 1
+
+
+async def test_zero_ttl_disables_cache(fake_pms, make_client):
+    fake_pms.route("/guests/G1", httpx.Response(200, json=guest_payload("G1")))
+    client = make_client(read_cache_ttl_seconds=0)
+
+    await client.get_guest("G1")
+    await client.get_guest("G1")
+
+    assert client._read_cache is None
+    assert len(fake_pms.calls("/guests/G1")) == 2
+
+
+async def test_entries_expire_after_ttl(fake_pms, make_client):
+    fake_pms.route("/guests/G1", httpx.Response(200, json=guest_payload("G1")))
+    client = make_client(read_cache_ttl_seconds=0.05)
+
+    await client.get_guest("G1")
+    await asyncio.sleep(0.1)
+    await client.get_guest("G1")
+
+    assert len(fake_pms.calls("/guests/G1")) == 2
+
+
+async def test_missing_resources_are_not_cached(fake_pms, make_client):
+    client = make_client()
+
+    assert await client.get_guest("NOPE") is None
+    assert await client.get_guest("NOPE") is None
+
+    assert len(fake_pms.calls("/guests/NOPE")) == 2
+
+
+async def test_check_in_invalidates_the_room(fake_pms, make_client):
+    fake_pms.route(
+        "/rooms/R1",
+        [
+            httpx.Response(200, json=room_payload("R1", "AVAILABLE")),
+            httpx.Response(200, json=room_payload("R1", "OCCUPIED")),
+        ],
+    )
+    fake_pms.route(
+        "/reservations/RES1/checkin",
+        httpx.Response(
+            200, json={"checkIn": {"roomNumber": "101", "guestName": "Jane Roe"}}
+        ),
+    )
+    client = make_client()
+
+    assert (await client.get_room("R1")).status == RoomStatus.AVAILABLE
+    await client.check_in("RES1", "R1")
+    assert (await client.get_room("R1")).status == RoomStatus.OCCUPIED
+
+
+async def test_check_out_invalidates_the_returned_room(fake_pms, make_client):
+    fake_pms.route(
+        "/rooms/R1/status",
+        [
+            httpx.Response(200, json={"status": "OCCUPIED"}),
+            httpx.Response(200, json={"status": "DIRTY"}),
+        ],
+    )
+    fake_pms.route(
+        "/reservations/RES1/checkout",
+        httpx.Response(
+            200,
+            json={
+                "checkOut": {
+                    "roomId": "R1",
+                    "roomNumber": "101",
+                    "guestName": "Jane Roe",
+                    "totalCharges": 400.0,
+                    "paymentsReceived": 400.0,
+                    "balanceDue": 0.0,
+                    "invoiceNumber": "INV-1",
+                }
+            },
+        ),
+    )
+    client = make_client()
+
+    assert await client.get_room_status("R1") == RoomStatus.OCCUPIED
+    await client.check_out("RES1")
+    assert await client.get_room_status("R1") == RoomStatus.DIRTY
+
+
+def etag_response(etag: str, first_name: str = "Jane") -> httpx.Response:
+    return httpx.Response(
+        200, json=guest_payload("G1", first_name), headers={"ETag": etag}
+    )
+
+
+async def test_unchanged_resource_revalidates_with_304(fake_pms, make_client):
+    fake_pms.route("/guests/G1", [etag_response('"v1"'), httpx.Response(304)])
+    client = make_client(read_cache_ttl_seconds=0)
+
+    first = await client.get_guest("G1")
+    second = await client.get_guest("G1")
+
+    assert second == first
+    requests = fake_pms.calls("/guests/G1")
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_changed_resource_replaces_the_validator(fake_pms, make_client):
+    fake_pms.route(
+        "/guests/G1",
+        [
+            etag_response('"v1"'),
+            etag_response('"v2"', first_name="Janet"),
+            httpx.Response(304),
+        ],
+    )
+    client = make_client(read_cache_ttl_seconds=0)
+
+    await client.get_guest("G1")
+    assert (await client.get_guest("G1")).first_name == "Janet"
+    assert (await client.get_guest("G1")).first_name == "Janet"
+
+    assert fake_pms.calls("/guests/G1")[2].headers["If-None-Match"] == '"v2"'
+
+
+async def test_expired_ttl_entry_is_revalidated(fake_pms, make_client):
+    fake_pms.route("/guests/G1", [etag_response('"v1"'), httpx.Response(304)])
+    client = make_client(read_cache_ttl_seconds=0.05)
+
+    await client.get_guest("G1")
+    await asyncio.sleep(0.1)
+    guest = await client.get_guest("G1")
+
+    assert guest is not None and guest.first_name == "Jane"
+    assert len(fake_pms.calls("/guests/G1")) == 2
+
+
+async def test_responses_without_etag_are_not_revalidated(fake_pms, make_client):
+    fake_pms.route("/guests/G1", httpx.Response(200, json=guest_payload("G1")))
+    client = make_client(read_cache_ttl_seconds=0)
+
+    await client.get_guest("G1")
+    await client.get_guest("G1")
+
+    assert all("If-None-Match" not in r.headers for r in fake_pms.calls("/guests/G1"))
+
+
+async def test_fresh_lookup_bypasses_ttl_cache(fake_pms, make_client):
+    fake_pms.route(
+        "/rooms/R1/status",
+        [
+            httpx.Response(200, json={"status": "OCCUPIED"}),
+            httpx.Response(200, json={"status": "DIRTY"}),
+        ],
+    )
+    client = make_client()
+
+    assert await client.get_room_status("R1") == RoomStatus.OCCUPIED
+    assert await client.get_room_status("R1", fresh=True) == RoomStatus.DIRTY
+    # The fresh result also refreshes the cache for later lookups.
+    assert await client.get_room_status("R1") == RoomStatus.DIRTY
+    assert len(fake_pms.calls("/rooms/R1/status")) == 2
+
+
+async def test_fresh_lookup_still_revalidates(fake_pms, make_client):
+    fake_pms.route("/guests/G1", [etag_response('"v1"'), httpx.Response(304)])
+    client = make_client()
+
+    first = await client.get_guest("G1")
+    second = await client.get_guest("G1", fresh=True)
+
+    assert second == first
+    assert fake_pms.calls("/guests/G1")[1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_write_during_an_in_flight_read_is_not_undone(fake_pms, make_client):
+    started = asyncio.Event()
+    release = asyncio.Event()
+    statuses = iter(["AVAILABLE", "OCCUPIED"])
+
+    async def room_status(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status == "AVAILABLE":
+            # The pre-check-in snapshot is still on the wire during the write.
+            started.set()
+            await release.wait()
+        return httpx.Response(200, json={"status": status})
+
+    fake_pms.route("/rooms/R1/status", room_status)
+    fake_pms.route(
+        "/reservations/RES1/checkin",
+        httpx.Response(
+            200, json={"checkIn": {"roomNumber": "101", "guestName": "Jane Roe"}}
+        ),
+    )
+    client = make_client()
+
+    stale = asyncio.create_task(client.get_room_status("R1"))
+    await started.wait()
+    await client.check_in("RES1", "R1")
+
+    # A read after the write neither joins the older request (which would
+    # block here until it is released)...
+    after_write = await asyncio.wait_for(client.get_room_status("R1"), timeout=1)
+    assert after_write == RoomStatus.OCCUPIED
+    release.set()
+    assert await stale == RoomStatus.AVAILABLE
+    # ...nor is the older response allowed to overwrite the cache.
+    assert await client.get_room_status("R1") == RoomStatus.OCCUPIED
+    assert len(fake_pms.calls("/rooms/R1/status")) == 2
+
+
+async def test_unconditional_read_does_not_join_a_conditional_one(
+    fake_pms, make_client
+):
+    release = asyncio.Event()
+
+    async def room(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match"):
+            await release.wait()
+            return httpx.Response(304)
+        return httpx.Response(200, json=room_payload("R1"), headers={"ETag": '"v1"'})
+
+    fake_pms.route("/rooms/R1", room)
+    fake_pms.route(
+        "/rooms/R2",
+        httpx.Response(200, json=room_payload("R2"), headers={"ETag": '"v9"'}),
+    )
+    client = make_client(read_cache_maxsize=1)
+
+    await client.get_room("R1")
+    conditional = asyncio.create_task(client.get_room("R1", fresh=True))
+    await asyncio.sleep(0)
+    # Evict R1's cached ETag, so the next lookup has no validator to send.
+    await client.get_room("R2")
+
+    unconditional = await asyncio.wait_for(client.get_room("R1"), timeout=1)
+    release.set()
+
+    assert unconditional is not None and unconditional.room_id == "R1"
+    assert (await conditional) == unconditional
@@ -0,0 +1,85 @@
+"""Tests for in-flight GET coalescing in SynXisPMSClient."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from synxis_pms_mcp.models import SynXisPMSError
+
+from .conftest import guest_payload
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def slow_pms(fake_pms):
+    fake_pms.delay = 0.02
+    fake_pms.route("/guests/G1", httpx.Response(200, json=guest_payload("G1")))
+    fake_pms.route("/guests/G2", httpx.Response(200, json=guest_payload("G2")))
+    return fake_pms
+
+
+async def test_concurrent_identical_gets_share_one_request(slow_pms, make_client):
+    client = make_client(read_cache_ttl_seconds=0)
+
+    guests = await asyncio.gather(*(client.get_guest("G1") for _ in range(5)))
+
+    assert {guest.guest_id for guest in guests} == {"G1"}
+    assert len(slow_pms.calls("/guests/G1")) == 1
+    assert client._inflight == {}
+
+
+async def test_distinct_gets_are_not_coalesced(slow_pms, make_client):
+    client = make_client(read_cache_ttl_seconds=0)
+
+    await asyncio.gather(client.get_guest("G1"), client.get_guest("G2"))
+
+    assert len(slow_pms.calls("/guests/G1")) == 1
+    assert len(slow_pms.calls("/guests/G2")) == 1
+
+
+async def test_cancelled_caller_does_not_cancel_followers(slow_pms, make_client):
+    client = make_client(read_cache_ttl_seconds=0)
+
+    first = asyncio.create_task(client.get_guest("G1"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(client.get_guest("G1"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    guest = await second
+    assert first.cancelled()
+    assert guest is not None and guest.guest_id == "G1"
+    assert len(slow_pms.calls("/guests/G1")) == 1
+
+
+async def test_shared_failure_reaches_every_caller(fake_pms, make_client):
+    fake_pms.delay = 0.02
+    fake_pms.route("/guests/G1", httpx.Response(400, json={"message": "bad id"}))
+    client = make_client(read_cache_ttl_seconds=0)
+
+    results = await asyncio.gather(
+        client.get_guest("G1"), client.get_guest("G1"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, SynXisPMSError) for r in results)
+    assert [r.message for r in results] == ["bad id", "bad id"]
+    assert len(fake_pms.calls("/guests/G1")) == 1
+
+
+async def test_writes_are_never_coalesced(fake_pms, make_client):
+    fake_pms.delay = 0.02
+    fake_pms.route(
+        "/reservations/R1/checkin",
+        httpx.Response(
+            200, json={"checkIn": {"roomNumber": "101", "guestName": "Jane Roe"}}
+        ),
+    )
+    client = make_client()
+
+    await asyncio.gather(client.check_in("R1", "ROOM1"), client.check_in("R1", "ROOM1"))
+
+    assert len(fake_pms.calls("/reservations/R1/checkin")) == 2
@@ -0,0 +1,43 @@
+"""Tests for room listing hydration in SynXisPMSClient."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+pytestmark = pytest.mark.unit
+
+
+def listing(*rows: dict[str, Any]) -> httpx.Response:
+    return httpx.Response(200, json={"rooms": list(rows)})
+
+
+COMPLETE_ROW = {
+    "roomId": "R1",
+    "roomNumber": "101",
+    "roomType": "DLX",
+    "roomTypeName": "Deluxe Room",
+    "floor": "1",
+    "status": "AVAILABLE",
+}
+
+
+async def test_rows_are_validated(fake_pms, make_client):
+    fake_pms.route("/rooms", listing(COMPLETE_ROW, {**COMPLETE_ROW, "roomId": "R2"}))
+    client = make_client()
+
+    rooms = await client.list_available_rooms()
+
+    assert [room.room_id for room in rooms] == ["R1", "R2"]
+    assert rooms[0].floor == 1
+
+
+async def test_incomplete_rows_fail_at_hydration(fake_pms, make_client):
+    fake_pms.route("/rooms", listing(COMPLETE_ROW, {"roomId": "R2", "status": "DIRTY"}))
+    client = make_client()
+
+    with pytest.raises(ValidationError, match="room_number"):
+        await client.list_available_rooms()
@@ -0,0 +1,88 @@
+"""Tests for request retries in SynXisPMSClient."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from synxis_pms_mcp import client as client_module
+from synxis_pms_mcp.models import SynXisPMSError
+
+from .conftest import guest_payload
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client_module, "_backoff_delay", lambda attempt: 0.0)
+
+
+@pytest.mark.parametrize("status", [429, 502, 503, 504])
+async def test_transient_status_is_retried(fake_pms, make_client, status):
+    fake_pms.route(
+        "/guests/G1",
+        [httpx.Response(status), httpx.Response(200, json=guest_payload("G1"))],
+    )
+    client = make_client()
+
+    guest = await client.get_guest("G1")
+
+    assert guest is not None
+    assert len(fake_pms.calls("/guests/G1")) == 2
+
+
+@pytest.mark.parametrize("status", [400, 403, 422, 500])
+async def test_other_errors_surface_immediately(fake_pms, make_client, status):
+    fake_pms.route("/guests/G1", httpx.Response(status, json={"message": "nope"}))
+    client = make_client()
+
+    with pytest.raises(SynXisPMSError) as exc_info:
+        await client.get_guest("G1")
+
+    assert exc_info.value.status == status
+    assert exc_info.value.message == "nope"
+    assert len(fake_pms.calls("/guests/G1")) == 1
+
+
+async def test_gives_up_after_max_retries(fake_pms, make_client):
+    fake_pms.route("/guests/G1", lambda request: httpx.Response(503, text="down"))
+    client = make_client(max_retries=3)
+
+    with pytest.raises(SynXisPMSError) as exc_info:
+        await client.get_guest("G1")
+
+    assert exc_info.value.status == 503
+    assert len(fake_pms.calls("/guests/G1")) == 3
+
+
+async def test_transport_errors_are_retried(fake_pms, make_client):
+    def unreachable(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    fake_pms.route("/guests/G1", unreachable)
+    client = make_client(max_retries=2)
+
+    with pytest.raises(SynXisPMSError) as exc_info:
+        await client.get_guest("G1")
+
+    assert exc_info.value.status == 503
+    assert len(fake_pms.calls("/guests/G1")) == 2
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected"),
+    [("2", 2.0), ("0.5", 0.5), ("-3", 0.0), ("3600", 60.0)],
+)
+def test_retry_after_is_honored_and_capped(retry_after, expected):
+    response = httpx.Response(503, headers={"Retry-After": retry_after})
+
+    assert client_module._retry_delay(0, response) == expected
+
+
+def test_retry_after_date_falls_back_to_backoff():
+    response = httpx.Response(
+        503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+
+    assert client_module._retry_delay(0, response) == 0.0
@@ -0,0 +1,30 @@
+"""Tests for SynXis PMS models and errors."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from synxis_pms_mcp.models import SynXisPMSError
+
+pytestmark = pytest.mark.unit
+
+
+def test_error_survives_pickling():
+    error = SynXisPMSError("boom", status=503, details={"a": 1})
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert (restored.message, restored.status, restored.details) == (
+        "boom",
+        503,
+        {"a": 1},
+    )
+
+
+def test_error_to_dict_omits_empty_details():
+    assert SynXisPMSError("boom", status=400).to_dict() == {
+        "error": "boom",
+        "status": 400,
+    }
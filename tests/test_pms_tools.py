@@ -0,0 +1,194 @@
+"""Tests for the batch PMS tools, run against the mock client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from synxis_pms_mcp.client import SynXisPMSClient
+from synxis_pms_mcp.config import SynXisPMSSettings
+from synxis_pms_mcp.models import RoomStatus, SynXisPMSError
+from synxis_pms_mcp.tools.pms_tools import register_pms_tools
+
+pytestmark = pytest.mark.mock
+
+BATCH_TOOLS = [
+    ("get_guests", "guest_ids", "get_guest", "guests"),
+    ("get_room_statuses", "room_ids", "get_room", "rooms"),
+    ("get_folios", "reservation_ids", "get_folio", "folios"),
+]
+
+
+@pytest.fixture
+def pms_client() -> SynXisPMSClient:
+    return SynXisPMSClient(SynXisPMSSettings(mock_mode=True))
+
+
+@pytest.fixture
+def app(pms_client: SynXisPMSClient) -> FastMCP:
+    app = FastMCP("synxis-pms-mcp-test")
+    register_pms_tools(app, pms_client)
+    return app
+
+
+async def call(app: FastMCP, tool: str, **arguments: Any) -> dict[str, Any]:
+    async with Client(app) as mcp:
+        result = await mcp.call_tool(tool, arguments, raise_on_error=False)
+    assert result.structured_content is not None
+    return result.structured_content
+
+
+@pytest.mark.parametrize(("tool", "arg", "method", "noun"), BATCH_TOOLS)
+async def test_duplicate_ids_are_fetched_once(
+    app, pms_client, monkeypatch, tool, arg, method, noun
+):
+    seen: list[str] = []
+    original = getattr(pms_client, method)
+
+    async def counting(item_id: str, **kwargs: Any) -> Any:
+        seen.append(item_id)
+        return await original(item_id, **kwargs)
+
+    monkeypatch.setattr(pms_client, method, counting)
+
+    response = await call(app, tool, **{arg: ["A", "B", "A"]})
+
+    assert response["success"] is True
+    assert response["message"] == f"Retrieved 2 of 2 {noun}"
+    assert list(response["data"]["results"]) == ["A", "B"]
+    assert sorted(seen) == ["A", "B"]
+
+
+@pytest.mark.parametrize(("tool", "arg", "method", "noun"), BATCH_TOOLS)
+async def test_empty_batch(app, tool, arg, method, noun):
+    response = await call(app, tool, **{arg: []})
+
+    assert response["success"] is True
+    assert response["message"] == f"Retrieved 0 of 0 {noun}"
+    assert response["data"] == {"results": {}}
+
+
+@pytest.mark.parametrize(("tool", "arg", "method", "noun"), BATCH_TOOLS)
+async def test_one_failing_id_does_not_fail_the_batch(
+    app, pms_client, monkeypatch, tool, arg, method, noun
+):
+    original = getattr(pms_client, method)
+
+    async def flaky(item_id: str, **kwargs: Any) -> Any:
+        if item_id == "BAD":
+            raise SynXisPMSError(message="upstream unavailable", status=503)
+        return await original(item_id, **kwargs)
+
+    monkeypatch.setattr(pms_client, method, flaky)
+
+    response = await call(app, tool, **{arg: ["A", "BAD", "B"]})
+
+    results = response["data"]["results"]
+    assert response["success"] is False
+    assert response["message"] == f"Retrieved 2 of 3 {noun}"
+    assert results["A"]["success"] is True
+    assert results["B"]["success"] is True
+    assert results["BAD"]["success"] is False
+    assert results["BAD"]["error"] == "upstream unavailable"
+
+
+async def test_batches_respect_max_parallel_requests(monkeypatch):
+    client = SynXisPMSClient(SynXisPMSSettings(mock_mode=True, max_parallel_requests=2))
+    running = peak = 0
+    original = client.get_guest
+
+    async def tracked(guest_id: str, **kwargs: Any) -> Any:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return await original(guest_id, **kwargs)
+
+    monkeypatch.setattr(client, "get_guest", tracked)
+
+    guests = await client.get_guests(["G1", "G2", "G3", "G4", "G1"])
+
+    assert [guest.guest_id for guest in guests] == ["G1", "G2", "G3", "G4", "G1"]
+    assert peak == 2
+
+
+@pytest.mark.parametrize(
+    ("tool", "arg", "method"),
+    [
+        ("get_guest", "guest_id", "get_guest"),
+        ("get_room_status", "room_id", "get_room"),
+    ],
+)
+@pytest.mark.parametrize("fresh", [False, True])
+async def test_single_lookups_forward_fresh(
+    app, pms_client, monkeypatch, tool, arg, method, fresh
+):
+    calls: list[bool] = []
+    original = getattr(pms_client, method)
+
+    async def recording(item_id: str, *, fresh: bool = False) -> Any:
+        calls.append(fresh)
+        return await original(item_id, fresh=fresh)
+
+    monkeypatch.setattr(pms_client, method, recording)
+
+    arguments: dict[str, Any] = {arg: "X1"}
+    if fresh:
+        arguments["fresh"] = True
+    response = await call(app, tool, **arguments)
+
+    assert response["success"] is True
+    assert calls == [fresh]
+
+
+async def test_single_lookup_payloads(app):
+    guest = (await call(app, "get_guest", guest_id="G1"))["data"]["guest"]
+    room = (await call(app, "get_room_status", room_id="R1"))["data"]["room"]
+
+    assert set(guest) == {
+        "guest_id",
+        "first_name",
+        "last_name",
+        "email",
+        "phone",
+        "loyalty_tier",
+        "vip_status",
+        "preferences",
+    }
+    assert guest["guest_id"] == "G1"
+    assert set(room) == {
+        "room_id",
+        "room_number",
+        "room_type",
+        "room_type_name",
+        "floor",
+        "status",
+        "features",
+        "max_occupancy",
+        "current_occupancy",
+    }
+    assert room["status"] in {status.value for status in RoomStatus}
+
+
+async def test_folio_payload(app):
+    folio = (await call(app, "get_folio", reservation_id="RES1"))["data"]
+
+    assert set(folio) == {
+        "folio_id",
+        "guest_name",
+        "room_number",
+        "charges",
+        "payments",
+        "total_charges",
+        "total_payments",
+        "balance",
+    }
+    assert all(
+        set(charge) == {"description", "amount", "category"}
+        for charge in folio["charges"]
+    )
+    assert folio["payments"] == [{"amount": 200.0, "method": "CREDIT_CARD"}]
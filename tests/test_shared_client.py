@@ -0,0 +1,128 @@
+"""Tests for the process-wide HTTP clients."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from synxis_pms_mcp.client import (
+    SynXisPMSClient,
+    close_shared_client,
+    get_shared_client,
+)
+from synxis_pms_mcp.config import SynXisPMSSettings
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+async def close_shared():
+    yield
+    await close_shared_client()
+
+
+async def test_same_transport_config_shares_a_client():
+    first = await get_shared_client(SynXisPMSSettings(timeout=5))
+    second = await get_shared_client(SynXisPMSSettings(timeout=5, property_id="P2"))
+
+    assert first is second
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"timeout": 9},
+        {"max_connections": 5},
+        {"http2": False},
+        {"base_url": "https://sandbox.synxis.com/pms/v1"},
+    ],
+)
+async def test_different_transport_config_gets_its_own_client(overrides):
+    default = await get_shared_client(SynXisPMSSettings())
+    other = await get_shared_client(SynXisPMSSettings(**overrides))
+
+    assert other is not default
+
+
+async def test_close_shared_client_closes_every_client():
+    first = await get_shared_client(SynXisPMSSettings())
+    second = await get_shared_client(SynXisPMSSettings(http2=False))
+
+    await close_shared_client()
+
+    assert first.is_closed and second.is_closed
+    assert await get_shared_client(SynXisPMSSettings()) is not first
+
+
+class _APIHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive, so they stay pooled between calls.
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply({"access_token": "token", "expires_in": 3600})
+
+    def do_GET(self) -> None:
+        self._reply({"guest": {"firstName": "Jane", "lastName": "Roe"}})
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_api() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _APIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_shared_client_works_across_event_loops(local_api):
+    settings = SynXisPMSSettings(
+        base_url=f"{local_api}/pms/v1",
+        client_id="client",
+        client_secret="secret",
+        mock_mode=False,
+    )
+
+    async def lookup() -> str | None:
+        guest = await SynXisPMSClient(settings).get_guest("G1")
+        return guest.first_name if guest else None
+
+    # Each asyncio.run closes its loop; the second must not reuse connections
+    # pooled by the first.
+    assert asyncio.run(lookup()) == "Jane"
+    assert asyncio.run(lookup()) == "Jane"
+
+
+async def test_each_event_loop_gets_its_own_client():
+    settings = SynXisPMSSettings()
+    here = await get_shared_client(settings)
+
+    def other_loop() -> object:
+        async def fetch() -> object:
+            client = await get_shared_client(settings)
+            await close_shared_client()
+            return client
+
+        return asyncio.run(fetch())
+
+    elsewhere = await asyncio.to_thread(other_loop)
+
+    assert elsewhere is not here
+    assert not here.is_closed